@@ -1,5 +1,8 @@
 import os
 import random
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import chess
 import chess.engine
@@ -10,7 +13,7 @@ matplotlib.use("QtAgg")
 import matplotlib.pyplot as plt
 plt.ion() 
 
-from src.transcribe import transcribe_audio
+from src.transcribe import transcribe_audio, warmup as warmup_asr
 from src.audio_utils import listen
 from src.visualize import BoardViewer
 from src.gen_audio import play_gen_audio
@@ -23,6 +26,12 @@ ENGINE_TIME_SEC = 0.5        # per-move think time (increase for stronger play)
 ENGINE_SKILL = 15             # 0-20 (may be ignored by some builds)
 HUMAN_PLAYS_WHITE = True      # set False to play Black
 
+# Shape of a spoken SAN move (normal moves and castling, no null moves)
+SAN_RE = re.compile(r"^(?:[O0]-[O0](?:-[O0])?|[KQRBN]?[a-h]?[1-8]?[-x]?[a-h][1-8](?:=?[QRBNqrbn])?)[+#]?\Z")
+
+# Spoken commands, matched case-insensitively before any SAN parsing
+CONTROL_WORDS = {"resign", "draw"}
+
 def main():
     board = chess.Board()
     print("Starting a new chess game (Player vs. Engine)")
@@ -36,12 +45,19 @@ def main():
     engine = chess.engine.SimpleEngine.popen_uci(STOCKFISH_PATH)
     engine.configure({"Skill Level": ENGINE_SKILL})
     
+    # Speech worker so engine-move audio overlaps the board redraw
+    tts_pool = ThreadPoolExecutor(max_workers=1)
+    
+    # Warm up the ASR server while the welcome message plays
+    threading.Thread(target=warmup_asr, daemon=True).start()
+    
     # Make announement at the beginning of the game.
     play_gen_audio("""Welcome to Voice Chess! This is Magnus Carlsen speaking. Do you want to play a game? Begin by saying your moves out loud. I'll let you go first.""")
     
     end_reason = None
+    outcome = None # only recomputed after a move is pushed
     try:
-        while not board.is_game_over():
+        while outcome is None:
             side_to_move_is_human = (board.turn == chess.WHITE) == HUMAN_PLAYS_WHITE
             
             if side_to_move_is_human:
@@ -52,22 +68,27 @@ def main():
                 move_text = transcribe_audio(move_audio).split()[0] # transcribes move audio into SAN
                 print("Transcription: ", move_text)
                 
-                if move_text == "resign":
-                    end_reason = "resign"
-                    break
-                elif move_text == "draw":
-                    # sample a number between 0 and 1
-                    if random.random() < 0.3:
-                        end_reason = "draw"
-                        viewer.update(board, show_last_move=True, text=f"Accepted")
+                command = move_text.lower()
+                if command in CONTROL_WORDS:
+                    if command == "resign":
+                        end_reason = "resign"
                         break
-                    else:
-                        play_gen_audio("I decline your draw offer. Let's continue.")
-                        viewer.update(board, show_last_move=True, text=f"Draw offer declined")
-                        continue
+                    elif command == "draw":
+                        # sample a number between 0 and 1
+                        if random.random() < 0.3:
+                            end_reason = "draw"
+                            viewer.update(board, show_last_move=True, text=f"Accepted")
+                            break
+                        else:
+                            play_gen_audio("I decline your draw offer. Let's continue.")
+                            viewer.update(board, show_last_move=True, text=f"Draw offer declined")
+                            continue
                 
                 try: # Tries to execute the move
-                    board.push_san(move_text)
+                    if not SAN_RE.match(move_text):
+                        raise ValueError(f"not a SAN move: {move_text!r}")
+                    board.push(board.parse_san(move_text))
+                    outcome = board.outcome()
                     print("Move executed")
                     viewer.update(board, show_last_move=True, text=f"Player move: {move_text}") # visualize board
                 except ValueError:
@@ -86,15 +107,16 @@ def main():
                     print("Engine failed to find a move.")
                     break
                 
-                san = board.san(result.move) # convert move to SAN for TTS
+                side = "white" if board.turn == chess.WHITE else "black"
+                san = board.san_and_push(result.move) # convert move to SAN for TTS and execute it
+                outcome = board.outcome()
                 print(f"Stockfish plays: {san}")
                 
-                side = "white" if board.turn == chess.WHITE else "black"
                 san_description = describe_san_first_person(san, side=side)
-                play_gen_audio(san_description) # generate and play audio of the engines move # generate and play audio of the engines move
+                tts_future = tts_pool.submit(play_gen_audio, san_description) # generate and play audio of the engines move
                 
-                board.push(result.move) # execute the move
                 viewer.update(board, show_last_move=True, text=f"Engine move: {san}") # visualize board
+                tts_future.result() # finish speaking before listening for the next move
                 
         board_results = {
             "1-0": "Congratulations, you win!",
@@ -104,7 +126,10 @@ def main():
             "draw": "I'll accept a draw. Good game!",
         }
         
-        result = board.result() if end_reason is None else end_reason
+        if end_reason is not None:
+            result = end_reason
+        else:
+            result = outcome.result() if outcome else "*"
         if end_reason == "draw":
             show_last_move = False
         else:
@@ -117,6 +142,7 @@ def main():
         print("\nGame interrupted by user.")
         
     finally:
+        tts_pool.shutdown(wait=False)
         try: engine.quit()
         except Exception: pass
         try: plt.close('all')
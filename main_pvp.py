@@ -1,14 +1,16 @@
 import chess
 import chess.pgn
-import time
 import random
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import matplotlib
 matplotlib.use("QtAgg")
 import matplotlib.pyplot as plt
 plt.ion()
 
-from transcribe import listen, transcribe_audio
+from transcribe import listen, transcribe_audio, warmup as warmup_asr
 from src.visualize import BoardViewer
 from src.gen_audio import play_gen_audio
 from commentary import chat
@@ -18,6 +20,12 @@ from describe_move import describe_san
 HUMAN_WHITE_NAME = "White"
 HUMAN_BLACK_NAME = "Black"
 
+# Shape of a spoken SAN move (normal moves and castling, no null moves)
+SAN_RE = re.compile(r"^(?:[O0]-[O0](?:-[O0])?|[KQRBN]?[a-h]?[1-8]?[-x]?[a-h][1-8](?:=?[QRBNqrbn])?)[+#]?\Z")
+
+# Spoken commands, matched case-insensitively before any SAN parsing
+CONTROL_WORDS = {"resign", "draw", "accept", "decline"}
+
 def main():
     board = chess.Board()
     print("Starting a new chess game (Player vs. Player)")
@@ -29,6 +37,9 @@ def main():
     viewer = BoardViewer(perspective="white")
     viewer.update(board, show_last_move=False, text="Game start")
     
+    # Warm up the ASR server while the welcome message plays
+    threading.Thread(target=warmup_asr, daemon=True).start()
+    
     # Make announement at the beginning of the game.
     play_gen_audio("""Welcome to Voice Chess! This is Magnus Carlsen speaking. You guys can start playing your game by saying your moves out loud.""")
     
@@ -36,10 +47,14 @@ def main():
     turns = {True: "White", False: "Black"}
     is_white_turn = True
     
+    # Commentary runs in the background while the board is redrawn
+    commentary_pool = ThreadPoolExecutor(max_workers=1)
+    
     end_reason = None
     pending_draw_offer = False
+    outcome = None # only recomputed after the move stack changes
     try:
-        while not board.is_game_over():
+        while outcome is None:
             player = turns[is_white_turn]
                     
             # Player move
@@ -49,29 +64,36 @@ def main():
             move_text = transcribe_audio(move_audio).split()[0] # transcribes move audio into SAN
             print("Transcription: ", move_text)
             
-            if move_text == "resign":
-                end_reason = f"{turns[is_white_turn]} resigns"
-                break
-            elif move_text == "draw":
-                pending_draw_offer = True
-                board.push(chess.Move.null()) 
-                viewer.update(board, show_last_move=False, text=f"{player} offers a draw.")
-                is_white_turn = not is_white_turn
-                continue
-            elif move_text == "accept" and pending_draw_offer:
-                end_reason = "draw"
-                viewer.update(board, show_last_move=False, text=f"Draw offer accepted")
-                break
-            elif move_text == "decline" and pending_draw_offer:
-                pending_draw_offer = False
-                board.pop()
-                is_white_turn = not is_white_turn
-                viewer.update(board, show_last_move=False, text=f"Draw offer declined")
-                continue
+            command = move_text.lower()
+            if command in CONTROL_WORDS:
+                if command == "resign":
+                    end_reason = f"{turns[is_white_turn]} resigns"
+                    break
+                elif command == "draw":
+                    pending_draw_offer = True
+                    board.push(chess.Move.null()) 
+                    outcome = board.outcome()
+                    viewer.update(board, show_last_move=False, text=f"{player} offers a draw.")
+                    is_white_turn = not is_white_turn
+                    continue
+                elif command == "accept" and pending_draw_offer:
+                    end_reason = "draw"
+                    viewer.update(board, show_last_move=False, text=f"Draw offer accepted")
+                    break
+                elif command == "decline" and pending_draw_offer:
+                    pending_draw_offer = False
+                    board.pop()
+                    outcome = board.outcome()
+                    is_white_turn = not is_white_turn
+                    viewer.update(board, show_last_move=False, text=f"Draw offer declined")
+                    continue
             
             try: # Tries to execute the move
+                if not SAN_RE.match(move_text):
+                    raise ValueError(f"not a SAN move: {move_text!r}")
                 move = board.parse_san(move_text)
-                board.push_san(move_text)
+                board.push(move) # reuse the parsed move instead of parsing the SAN again
+                outcome = board.outcome()
                 node = node.add_main_variation(move)
 
                 print("Move executed")
@@ -82,18 +104,21 @@ def main():
                 viewer.update(board, show_last_move=True, text=f"Player move: {move_text} - Invalid!")
                 continue
             
-            viewer.update(board, show_last_move=True, text=f"{player} move: {move_text}") # visualize board
-            
-            # Porvide commentary on the game (50% chance)
+            # Porvide commentary on the game (50% chance), started before the redraw
+            commentary_future = None
             if random.random() < 0.5:
-                    comment = chat(str(game), max_tokens=2048)
-                    print("Commentary: ", comment)
-                    play_gen_audio(comment)
-                    
-            viewer.flip()
-            time.sleep(0.5)
+                commentary_future = commentary_pool.submit(chat, str(game), max_tokens=2048)
+            
+            # Show the move from the next player's side in a single redraw
+            viewer.set_perspective("black" if is_white_turn else "white")
             viewer.update(board, show_last_move=True, text=f"{player} move: {move_text}") # visualize board
             
+            # Speak the commentary before listening again, so the mic doesn't record it
+            if commentary_future is not None:
+                comment = commentary_future.result()
+                print("Commentary: ", comment)
+                play_gen_audio(comment)
+            
             is_white_turn = not is_white_turn
             
         board_results = {
@@ -114,7 +139,10 @@ def main():
             "draw": f"{player} accepted the draw.",
         }
         
-        result = board.result() if end_reason is None else end_reason
+        if end_reason is not None:
+            result = end_reason
+        else:
+            result = outcome.result() if outcome else "*"
         if end_reason == "draw":
             show_last_move = False
         else:
@@ -126,6 +154,7 @@ def main():
         print("\nGame interrupted.")
         
     finally:
+        commentary_pool.shutdown(wait=False)
         try: plt.close('all')
         except Exception: pass
         
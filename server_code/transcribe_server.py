@@ -1,7 +1,10 @@
 from flask import Flask, request, jsonify
 import base64
+import io
 import openai
 import os
+import struct
+import soundfile as sf
 
 API_KEY = os.getenv("BOSON_API_KEY")
 BASE_URL = os.getenv("BOSON_BASE_URL", "http://localhost:8080/v1")
@@ -32,24 +35,66 @@ Instructions:
 
 app = Flask(__name__)
 
+
+def flac_to_wav_bytes(flac_bytes: bytes) -> bytes:
+    """Decode a FLAC upload to 16-bit WAV, the format the ASR model takes."""
+    audio, sr = sf.read(io.BytesIO(flac_bytes), dtype="int16")
+    mem = io.BytesIO()
+    sf.write(mem, audio, sr, format="WAV", subtype="PCM_16")
+    return mem.getvalue()
+
+
+def pcm_to_wav_bytes(pcm: bytes, rate: int, channels: int) -> bytes:
+    """Put the 44-byte RIFF header in front of a raw little-endian PCM16 upload."""
+    n = len(pcm)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + n, b"WAVE",
+        b"fmt ", 16, 1, channels, rate, rate * channels * 2, channels * 2, 16,
+        b"data", n,
+    )
+    return header + pcm
+
+
 @app.route("/transcribe", methods=["POST"])
 def transcribe():
     """
     Transcribe an uploaded audio file into chess move notation.
 
     Request:
+        Raw WAV or FLAC body with Content-Type "audio/wav" / "audio/flac",
+        raw little-endian PCM16 with "audio/x-pcm-s16le; rate=<hz>; channels=<n>", or
         multipart/form-data with "audio" field (WAV file).
 
     Response (JSON):
         {"transcription": "<SAN move>"}
     """
-    if "audio" not in request.files:
+    if request.mimetype == "audio/wav":
+        audio_bytes = request.get_data()
+    elif request.mimetype == "audio/flac":
+        try:
+            audio_bytes = flac_to_wav_bytes(request.get_data())
+        except RuntimeError as e:  # soundfile.LibsndfileError on a bad body
+            return jsonify({"error": f"Invalid FLAC audio: {e}"}), 400
+    elif request.mimetype == "audio/x-pcm-s16le":
+        params = request.mimetype_params
+        pcm = request.get_data()
+        try:
+            rate = int(params.get("rate", 16000))
+            channels = int(params.get("channels", 1))
+        except ValueError:
+            return jsonify({"error": "rate and channels must be integers"}), 400
+        if not (0 < rate <= 384000 and 0 < channels <= 8):
+            return jsonify({"error": "rate or channels out of range"}), 400
+        if len(pcm) % (2 * channels):
+            return jsonify({"error": "PCM body is not a whole number of 16-bit frames"}), 400
+        audio_bytes = pcm_to_wav_bytes(pcm, rate, channels)
+    elif "audio" in request.files:
+        audio_bytes = request.files["audio"].read()
+    else:
         return jsonify({"error": "No audio file uploaded"}), 400
 
-    audio_file = request.files["audio"]
-
     # Convert to base64
-    audio_bytes = audio_file.read()
     audio_b64 = base64.b64encode(audio_bytes).decode("utf-8")
 
     # Call ASR model
@@ -5,12 +5,16 @@ import os
 import sys
 import uuid
 import base64
+import struct
+import threading
 from pathlib import Path
 from typing import Literal, Optional
 
+import numpy as np
 import torch
 import soundfile as sf
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 from loguru import logger
@@ -30,6 +34,7 @@ OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 AUDIO_TOKENIZER_PATH = os.getenv("HIGGS_AUDIO_TOKENIZER", "bosonai/higgs-audio-v2-tokenizer")
 MODEL_PATH = os.getenv("HIGGS_MODEL_PATH", "bosonai/higgs-audio-v2-generation-3B-base")
+STREAM_BLOCK_BYTES = 8192  # PCM bytes per chunk in "stream" mode
 
 # Logging
 logger.remove()
@@ -56,7 +61,7 @@ class GenerateRequest(BaseModel):
     scene_prompt: Optional[str] = None
     ref_audio: Optional[str] = None
     ref_audio_in_system_message: bool = False
-    return_audio: Literal["base64", "url"] = "base64"
+    return_audio: Literal["binary", "base64", "url", "stream"] = "binary"
     filename: Optional[str] = None  # only used for URL mode
 
 class GenerateResponse(BaseModel):
@@ -71,8 +76,37 @@ class HealthResponse(BaseModel):
     dtype: str
 
 
+def _wav_stream_header(sample_rate: int, channels: int = 1) -> bytes:
+    """RIFF header for 16-bit PCM of unknown length (sizes left at the maximum)."""
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 0xFFFFFFFF, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16,
+        b"data", 0xFFFFFFFF,
+    )
+
+
+def _to_pcm16(wv) -> bytes:
+    """Convert float audio in [-1, 1] to little-endian 16-bit PCM bytes."""
+    return (np.clip(wv, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
 # Globals (model stays warm)
 MODEL_CLIENT: Optional[HiggsAudioModelClient] = None
+# One static KV cache per client, so only one generate() call may run at a time
+GENERATE_LOCK = threading.Lock()
+
+
+def _voice_context(ref_audio_in_system_message: bool = False):
+    """Messages & audio_ids (voice prompts) for the Magnus reference voice."""
+    return prepare_generation_context(
+        scene_prompt="./scene_prompts/quiet_room.txt",
+        ref_audio="magnus",
+        ref_audio_in_system_message=ref_audio_in_system_message,
+        audio_tokenizer=MODEL_CLIENT._audio_tokenizer,
+        speaker_tags=[],  # single-speaker default; pass tags if you want
+    )
+
 
 @app.on_event("startup")
 def _startup():
@@ -88,6 +122,23 @@ def _startup():
         max_new_tokens=2048,
         use_static_kv_cache=(device.startswith("cuda")),
     )
+    # One short generation so the first /generate call doesn't pay for
+    # kernel selection, allocator growth and reference-voice setup
+    defaults = GenerateRequest(transcript="Hello.")
+    messages, audio_ids = _voice_context()
+    with GENERATE_LOCK:
+        MODEL_CLIENT.generate(
+            messages=messages,
+            audio_ids=audio_ids,
+            chunked_text=[defaults.transcript],
+            generation_chunk_buffer_size=defaults.generation_chunk_buffer_size,
+            temperature=defaults.temperature,
+            top_k=defaults.top_k,
+            top_p=defaults.top_p,
+            ras_win_len=defaults.ras_win_len,
+            ras_win_max_num_repeat=defaults.ras_win_max_num_repeat,
+            seed=defaults.seed,
+        )
     logger.info("Model warmed and ready.")
 
 @app.get("/health", response_model=HealthResponse)
@@ -99,9 +150,20 @@ def health() -> HealthResponse:
         dtype=str(MODEL_CLIENT._model.dtype),
     )
 
-@app.post("/generate", response_model=GenerateResponse)
+@app.post(
+    "/generate",
+    response_model=GenerateResponse,
+    responses={200: {
+        "description": "WAV audio for return_audio=binary/stream; JSON for base64/url",
+        "content": {"audio/wav": {}},
+    }},
+)
 def generate(req: GenerateRequest, request: Request) -> GenerateResponse:
-    """Generate audio from text using the Higgs Audio V2 generation model."""
+    """
+    Generate audio from text using the Higgs Audio V2 generation model.
+    Only return_audio="base64"/"url" answer with GenerateResponse JSON; "binary"
+    (the default) and "stream" return an audio/wav body.
+    """
     assert MODEL_CLIENT is not None
     # Normalize transcript (match your CLI behavior)
     transcript = normalize_chinese_punctuation(req.transcript).strip()
@@ -109,13 +171,7 @@ def generate(req: GenerateRequest, request: Request) -> GenerateResponse:
         transcript += "."
 
     # Prepare messages & audio_ids (voice prompts)
-    messages, audio_ids = prepare_generation_context(
-        scene_prompt="./scene_prompts/quiet_room.txt",
-        ref_audio="magnus",
-        ref_audio_in_system_message=req.ref_audio_in_system_message,
-        audio_tokenizer=MODEL_CLIENT._audio_tokenizer,
-        speaker_tags=[],  # single-speaker default; pass tags if you want
-    )
+    messages, audio_ids = _voice_context(req.ref_audio_in_system_message)
 
     # Chunking
     chunked_text = prepare_chunk_text(
@@ -125,11 +181,7 @@ def generate(req: GenerateRequest, request: Request) -> GenerateResponse:
         chunk_max_num_turns=req.chunk_max_num_turns,
     )
 
-    # Generate
-    concat_wv, sr, _ = MODEL_CLIENT.generate(
-        messages=messages,
-        audio_ids=audio_ids,
-        chunked_text=chunked_text,
+    gen_kwargs = dict(
         generation_chunk_buffer_size=req.generation_chunk_buffer_size,
         temperature=req.temperature,
         top_k=req.top_k,
@@ -139,11 +191,46 @@ def generate(req: GenerateRequest, request: Request) -> GenerateResponse:
         seed=req.seed,
     )
 
+    if req.return_audio == "stream":
+        # Generate chunk by chunk and send each one as soon as it is ready,
+        # so the client starts playing after the first chunk instead of the last
+        def wav_chunks():
+            header_sent = False
+            for chunk in chunked_text:
+                with GENERATE_LOCK:
+                    wv, sr, _ = MODEL_CLIENT.generate(
+                        messages=messages,
+                        audio_ids=audio_ids,
+                        chunked_text=[chunk],
+                        **gen_kwargs,
+                    )
+                if not header_sent:
+                    yield _wav_stream_header(sr)
+                    header_sent = True
+                pcm = _to_pcm16(wv)
+                for i in range(0, len(pcm), STREAM_BLOCK_BYTES):
+                    yield pcm[i:i + STREAM_BLOCK_BYTES]
+
+        return StreamingResponse(wav_chunks(), media_type="audio/wav")
+
+    # Generate
+    with GENERATE_LOCK:
+        concat_wv, sr, _ = MODEL_CLIENT.generate(
+            messages=messages,
+            audio_ids=audio_ids,
+            chunked_text=chunked_text,
+            **gen_kwargs,
+        )
+
     # Encode to WAV in memory (seekable buffer)
     mem = io.BytesIO()
     sf.write(mem, concat_wv, sr, format="WAV")
     mem.seek(0)
 
+    if req.return_audio == "binary":
+        # Raw WAV body: no base64 inflation or JSON wrapping
+        return Response(content=mem.getvalue(), media_type="audio/wav")
+
     if req.return_audio == "base64":
         b64 = base64.b64encode(mem.read()).decode("utf-8")
         return GenerateResponse(id=str(uuid.uuid4()), audio_base64=b64, sample_rate=sr)
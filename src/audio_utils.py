@@ -1,4 +1,6 @@
 import collections
+import math
+import queue
 import sounddevice as sd
 import webrtcvad
 import time
@@ -8,6 +10,7 @@ import numpy as np
 RATE = 16000
 CHANNELS = 1
 FRAME_DURATION = 30  
+FRAME_LEN = int(RATE * FRAME_DURATION / 1000)  # samples per frame
 
 PRE_BUFFER_MS = 800  
 POST_BUFFER_MS = 1200
@@ -19,39 +22,67 @@ VAD_AGGRESSIVENESS = 0
 TRIGGER_THRESHOLD_START = 0.55   
 TRIGGER_THRESHOLD_END   = 0.80   
 
+# Buffer sizes (frames) and the integer vote counts the thresholds imply
+PRE_N  = max(1, int(PRE_BUFFER_MS  / FRAME_DURATION))
+POST_N = max(1, int(POST_BUFFER_MS / FRAME_DURATION))
+START_VOICED_MIN = math.floor(TRIGGER_THRESHOLD_START * PRE_N) + 1   # voiced frames to start
+END_UNVOICED_MIN = math.floor(TRIGGER_THRESHOLD_END * POST_N) + 1    # unvoiced frames to end
+
 # Energy thresholds
 FRAME_RMS_MIN  = 400
 CHUNK_RMS_MIN  = 300
 
+# Per-frame energy threshold (sum of squares), equivalent to FRAME_RMS_MIN
+FRAME_RMS_MIN_SQ = FRAME_RMS_MIN ** 2 * FRAME_LEN
+
+# Adaptive end-of-speech gate: NOISE_FLOOR_FACTOR x the background RMS
+NOISE_FLOOR_ALPHA  = 0.1   # EMA weight of each new non-speech frame
+NOISE_FLOOR_FACTOR = 3
+
 vad = webrtcvad.Vad(VAD_AGGRESSIVENESS)
 
+# Per-frame VAD/energy decision, computed once when the frame arrives
+FrameInfo = collections.namedtuple("FrameInfo", ["pcm", "is_speech", "energy_ok"])
+
+
+def frame_energy(pcm_bytes: bytes) -> int:
+    """Sum of squared samples of int16 PCM audio, computed in integers."""
+    arr = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.int64)
+    return int(arr @ arr)
+
 
 def rms16(pcm_bytes: bytes) -> float:
     """Root-mean-square of int16 PCM audio."""
-    if not pcm_bytes:
-        return 0.0
-    arr = np.frombuffer(pcm_bytes, dtype=np.int16)
-    if arr.size == 0:
+    n = len(pcm_bytes) // 2
+    if n == 0:
         return 0.0
-    return float(np.sqrt(np.mean(arr.astype(np.float32) ** 2)))
+    # One integer dot product instead of a float32 squared copy
+    return math.sqrt(frame_energy(pcm_bytes) / n)
 
 
 def frame_generator():
     """
     Generator that yields frames of audio (PCM16) from the microphone.
     Frame size is determined by RATE and FRAME_DURATION.
+    Frames are captured by a PortAudio callback and handed over through a queue.
     """
-    frame_len = int(RATE * FRAME_DURATION / 1000)
-    with sd.InputStream(
+    frames = queue.SimpleQueue()
+
+    def callback(indata, frame_count, time_info, status):
+        # Runs on the audio thread: copy the block out and return right away
+        frames.put(bytes(indata))
+
+    # Raw stream hands back a plain buffer, no intermediate NumPy array
+    with sd.RawInputStream(
         samplerate=RATE,
         channels=CHANNELS,
         dtype='int16',
-        blocksize=frame_len,   # deliver frames at our desired size
-        latency='low'
-    ) as stream:
+        blocksize=FRAME_LEN,   # deliver frames at our desired size
+        latency='low',
+        callback=callback,
+    ):
         while True:
-            data, _ = stream.read(frame_len)
-            yield data.tobytes()
+            yield frames.get()
             
             
 # Listen for one full chess move 
@@ -70,51 +101,71 @@ def listen():
     (__import__('winsound').Beep(1200,120) if __import__('sys').platform.startswith('win') else __import__('subprocess').run(['afplay','/System/Library/Sounds/Ping.aiff']) if __import__('sys').platform=='darwin' else __import__('subprocess').run(['paplay','/usr/share/sounds/freedesktop/stereo/message.oga'])) 
     frames = frame_generator()
 
-    pre_n  = max(1, int(PRE_BUFFER_MS  / FRAME_DURATION))
-    post_n = max(1, int(POST_BUFFER_MS / FRAME_DURATION))
-
-    pre_buffer_frames  = collections.deque(maxlen=pre_n)
-    post_buffer_frames = collections.deque(maxlen=post_n)
+    pre_buffer_frames  = collections.deque(maxlen=PRE_N)
+    post_buffer_frames = collections.deque(maxlen=POST_N)
 
     triggered = False
     voiced_frames = []
     chunk_start_time = None
 
+    # Running vote counts over the buffers, updated as frames enter/leave
+    voiced_votes = 0
+    end_unvoiced_votes = 0
+
+    # Background energy (EMA over non-speech frames) and the frame energy
+    # gate used for end detection, fixed when speech starts
+    noise_energy = 0.0
+    active_min_sq = FRAME_RMS_MIN_SQ
+
+    # Bind the per-frame calls once, outside the real-time loop
+    is_speech = vad.is_speech
+    pre_append = pre_buffer_frames.append
+    post_append = post_buffer_frames.append
+
     print("Listening for your chess move...")
 
     for frame in frames:
-        vad_flag = vad.is_speech(frame, RATE)
-        energy_ok = (rms16(frame) >= FRAME_RMS_MIN)
+        # Classify each frame exactly once
+        vad_flag = is_speech(frame, RATE)
+        energy = frame_energy(frame)
+        energy_ok = (energy >= active_min_sq)
+        info = FrameInfo(frame, vad_flag, energy_ok)
 
         if not triggered:
+            if not vad_flag:
+                noise_energy += NOISE_FLOOR_ALPHA * (energy - noise_energy)
+
             # Start detection
-            pre_buffer_frames.append(frame)
-            voiced_votes = sum(1 for f in pre_buffer_frames if vad.is_speech(f, RATE))
+            if len(pre_buffer_frames) == PRE_N:
+                voiced_votes -= pre_buffer_frames[0].is_speech
+            pre_append(info)
+            voiced_votes += info.is_speech
             
-            if (len(pre_buffer_frames) == pre_buffer_frames.maxlen and
-                voiced_votes > TRIGGER_THRESHOLD_START * len(pre_buffer_frames)):
+            if len(pre_buffer_frames) == PRE_N and voiced_votes >= START_VOICED_MIN:
                 triggered = True
                 chunk_start_time = time.time()
+                active_min_sq = max(FRAME_RMS_MIN_SQ, NOISE_FLOOR_FACTOR ** 2 * noise_energy)
                 
-                voiced_frames.extend(pre_buffer_frames)
+                voiced_frames.extend(f.pcm for f in pre_buffer_frames)
                 pre_buffer_frames.clear()
+                voiced_votes = 0
                 print("Speech detected")
         else:
             # Collecting speech
             voiced_frames.append(frame)
-            post_buffer_frames.append(frame)
 
             # End detection 
-            end_unvoiced_votes = sum(
-                1 for f in post_buffer_frames if not (vad.is_speech(f, RATE) and rms16(f) >= FRAME_RMS_MIN)
-            )
+            if len(post_buffer_frames) == POST_N:
+                oldest = post_buffer_frames[0]
+                end_unvoiced_votes -= not (oldest.is_speech and oldest.energy_ok)
+            post_append(info)
+            end_unvoiced_votes += not (info.is_speech and info.energy_ok)
             chunk_len = time.time() - chunk_start_time
 
-            if ((len(post_buffer_frames) == post_buffer_frames.maxlen and
-                 end_unvoiced_votes > TRIGGER_THRESHOLD_END * len(post_buffer_frames))
+            if ((len(post_buffer_frames) == POST_N and end_unvoiced_votes >= END_UNVOICED_MIN)
                 or chunk_len >= MAX_CHUNK_SEC):
                 
-                voiced_frames.extend(post_buffer_frames)
+                voiced_frames.extend(f.pcm for f in post_buffer_frames)
 
                 total_chunk_len = time.time() - chunk_start_time
                 chunk_bytes = b"".join(voiced_frames)
@@ -127,4 +178,5 @@ def listen():
                     # Too short/quiet - reset and keep listening
                     triggered = False
                     voiced_frames = []
-                    post_buffer_frames.clear() 
\ No newline at end of file
+                    post_buffer_frames.clear()
+                    end_unvoiced_votes = 0
\ No newline at end of file
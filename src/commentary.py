@@ -4,6 +4,8 @@ import os
 
 import re
 from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # Config
@@ -17,6 +19,18 @@ MODEL = os.getenv(
 )
 
 
+# Kept-alive connection to the LLM server; connection failures are retried briefly
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2,
+                       max_retries=Retry(total=2, backoff_factor=0.1))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Tag patterns, compiled once
+_THINK_END = re.compile(r"</think\s*>", re.IGNORECASE)
+_ANSWER = re.compile(r"<answer\s*>(.*?)</answer\s*>", re.IGNORECASE | re.DOTALL)
+
+
 system_prompt = """
 You are a chess commentator. 
 Given the current board position in a string representation, provide a very short comment of the game. 
@@ -31,20 +45,48 @@ def extract_last_answer_after_think(text: str) -> Optional[str]:
     AFTER the final </think> tag. If not found (or no </think>), returns None.
     Tag matching is case-insensitive and spans newlines.
     """
-    # Find the end position of the last </think>
+    # Find the end position of the last </think>: search backwards for the
+    # tag prefix and confirm each candidate, instead of scanning the whole text
     last_think_end = -1
-    for m in re.finditer(r"</think\s*>", text, flags=re.IGNORECASE):
-        last_think_end = m.end()
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        idx = lowered.rfind("</think")
+        while idx != -1:
+            m = _THINK_END.match(text, idx)
+            if m:
+                last_think_end = m.end()
+                break
+            idx = lowered.rfind("</think", 0, idx)
+    else:
+        # lower() changed the length, so indices don't line up; scan instead
+        for m in _THINK_END.finditer(text):
+            last_think_end = m.end()
     if last_think_end == -1:
         return None  # no </think> present
 
-    # Find all <answer>...</answer> AFTER that position
-    pattern = re.compile(r"<answer\s*>(.*?)</answer\s*>", re.IGNORECASE | re.DOTALL)
-    matches = list(pattern.finditer(text, pos=last_think_end))
-    if not matches:
+    # Take the last <answer>...</answer> AFTER that position
+    last = None
+    for last in _ANSWER.finditer(text, last_think_end):
+        pass
+    if last is None:
         return None
 
-    return matches[-1].group(1).strip()
+    return last.group(1).strip()
+
+
+def _stream_content(r):
+    """Yield the content deltas of an OpenAI-style SSE chat completion."""
+    for line in r.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        choices = json.loads(data).get("choices")
+        if choices:
+            delta = (choices[0].get("delta") or {}).get("content")
+            if delta:
+                yield delta
 
 
 def chat(board_content: str, **kwargs):
@@ -57,6 +99,8 @@ def chat(board_content: str, **kwargs):
             - max_tokens (int)
             - temperature (float)
             - top_p (float)
+            - stream (bool, default True): stream tokens and stop reading
+              as soon as the answer is complete
 
     Returns:
         A one-sentence commentary string.
@@ -65,6 +109,7 @@ def chat(board_content: str, **kwargs):
     {"role": "system", "content": system_prompt},
     {"role": "user", "content": board_content},
     ]
+    stream = kwargs.get("stream", True)
     payload = {
         "model": MODEL,
         "messages": messages,
@@ -72,19 +117,36 @@ def chat(board_content: str, **kwargs):
         "max_tokens": kwargs.get("max_tokens", 512),
         "temperature": kwargs.get("temperature", 0.2),
         "top_p": kwargs.get("top_p", 1.0),
-        # "stream": True,  # uncomment if your server supports SSE streaming
+        "stream": stream,
     }
-    r = requests.post(
+    r = SESSION.post(
         BASE_URL,
-        headers={"Content-Type": "application/json"},
-        data=json.dumps(payload),
+        json=payload,  # serialized by requests, which also sets the Content-Type
         timeout=120,
+        stream=stream,
     )
     r.raise_for_status()
-    data = r.json()
-    # Most OpenAI-compatible servers return the text here:
-    generated_text = data["choices"][0]["message"]["content"]
-    final_text = extract_last_answer_after_think(generated_text)
+    if stream and r.headers.get("Content-Type", "").startswith("text/event-stream"):
+        # Stop at the first complete answer after </think>; closing the
+        # response lets the server abort the rest of the generation
+        generated_text = ""
+        final_text = None
+        with r:
+            for delta in _stream_content(r):
+                generated_text += delta
+                if "</answer" in generated_text[-(len(delta) + 8):].lower():
+                    final_text = extract_last_answer_after_think(generated_text)
+                    if final_text is not None:
+                        break
+        if final_text is None:
+            # The quick tail check can miss a split or padded closing tag
+            final_text = extract_last_answer_after_think(generated_text)
+    else:
+        # Also taken when the server ignored "stream" and sent plain JSON
+        data = r.json()
+        # Most OpenAI-compatible servers return the text here:
+        generated_text = data["choices"][0]["message"]["content"]
+        final_text = extract_last_answer_after_think(generated_text)
     if final_text is None:
         return "No comment."
     else:
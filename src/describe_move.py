@@ -1,5 +1,54 @@
 import re
+from functools import lru_cache
 
+# SAN patterns, compiled once at import and shared by both describers
+_EP_RE = re.compile(r'\b(e\.?p\.?)\b', re.IGNORECASE)            # en passant marker
+_EP_STRIP_RE = re.compile(r'\s*\b(e\.?p\.?)\b', re.IGNORECASE)  # ...with leading space
+_CHK_RE = re.compile(r'(#|\+\+|\+)([!?]*)$')                      # check/mate (+ annotations)
+_ANN_RE = re.compile(r'[!?]+$')                                    # trailing annotations
+_CASTLE_RE = re.compile(r'(O|0)-(O|0)(-(O|0))?')
+_QUEENSIDE_RE = re.compile(r'-(O|0)$')
+_DEST_RE = re.compile(r'([a-h][1-8])')
+
+_PIECES = "KQRBN"
+_PROMOS = "QRBN"
+_FILES = "abcdefgh"
+_RANKS = "12345678"
+_COORDS = _FILES + _RANKS
+
+
+def _parse_san(s: str):
+    """
+    Split a bare SAN move (no check/annotation suffix) into
+    (piece, disambig, capture, dest, promo), or return None if it isn't one.
+    Same grammar as [KQRBN]?[a-h1-8]{0,2}x?[a-h][1-8](=?[QRBN])?, parsed by hand.
+    """
+    end = len(s)
+    promo = None
+    if end and s[-1] in _PROMOS:
+        promo = s[-1]
+        end -= 2 if end >= 2 and s[-2] == "=" else 1
+    if end < 2 or s[end - 2] not in _FILES or s[end - 1] not in _RANKS:
+        return None
+    dest = s[end - 2:end]
+    end -= 2
+    capture = end > 0 and s[end - 1] == "x"
+    if capture:
+        end -= 1
+    start = 0
+    piece = None
+    if end > 0 and s[0] in _PIECES:
+        piece = s[0]
+        start = 1
+    disambig = s[start:end]
+    if len(disambig) > 2:
+        return None
+    for c in disambig:
+        if c not in _COORDS:
+            return None
+    return piece, disambig, capture, dest, promo
+
+@lru_cache(maxsize=4096)
 def describe_san_first_person(move: str, side: str | None = None) -> str:
     """
     Convert a SAN chess move into a first-person, *future-tense* natural description.
@@ -32,66 +81,56 @@ def describe_san_first_person(move: str, side: str | None = None) -> str:
             return f"{file_letter}8"
         return None
 
-    def add_check_suffix(desc: str, chk: str | None) -> str:
+    def add_check_suffix(parts: list[str], chk: str | None) -> str:
         if chk == "mate":
-            return desc + ", checkmate."
-        if chk == "double":
-            return desc + ", with double check."
-        if chk == "check":
-            return desc + ", with check."
-        return desc + "."
+            parts.append(", checkmate.")
+        elif chk == "double":
+            parts.append(", with double check.")
+        elif chk == "check":
+            parts.append(", with check.")
+        else:
+            parts.append(".")
+        return "".join(parts)
 
     s = original
 
     # En passant marker
-    ep = bool(re.search(r'\b(e\.?p\.?)\b', s, flags=re.IGNORECASE))
-    s = re.sub(r'\s*\b(e\.?p\.?)\b', '', s, flags=re.IGNORECASE).strip()
+    ep = bool(_EP_RE.search(s))
+    s = _EP_STRIP_RE.sub('', s).strip()
 
     # Extract check/mate
     chk = None
-    m_chk = re.search(r'(#|\+\+|\+)([!?]*)$', s)
+    m_chk = _CHK_RE.search(s)
     if m_chk:
         token = m_chk.group(1)
         chk = "mate" if token == "#" else ("double" if token == "++" else "check")
         s = s[:m_chk.start(1)]
 
     # Strip trailing annotations
-    s = re.sub(r'[!?]+$', '', s).strip()
+    s = _ANN_RE.sub('', s).strip()
 
     # Castling
-    if re.fullmatch(r'(O|0)-(O|0)(-(O|0))?', s):
-        is_queenside = bool(re.search(r'-(O|0)$', s))
+    if _CASTLE_RE.fullmatch(s):
+        is_queenside = bool(_QUEENSIDE_RE.search(s))
         side_word = "queenside" if is_queenside else "kingside"
         file_letter = "c" if is_queenside else "g"
         dest = side_square(file_letter, side)
+        parts = ["I will castle ", side_word]
         if dest:
-            desc = f"I will castle {side_word} to {dest}"
-        else:
-            desc = f"I will castle {side_word}"
-        return add_check_suffix(desc, chk)
+            parts += (" to ", dest)
+        return add_check_suffix(parts, chk)
 
     # General SAN parsing
-    pattern = re.compile(
-        r'^(?P<piece>[KQRBN])?'                # Optional piece (pawn if absent)
-        r'(?P<disambig>[a-h1-8]{0,2})'         # Optional disambiguation
-        r'(?P<capture>x)?'                     # Optional capture
-        r'(?P<dest>[a-h][1-8])'                # Destination
-        r'(?:=(?P<promo1>[QRBN])|(?P<promo2>[QRBN]))?'  # Optional promotion
-        r'$'
-    )
-    m = pattern.match(s)
-    if not m:
-        m2 = re.search(r'([a-h][1-8])', s)
+    parsed = _parse_san(s)
+    if parsed is None:
+        m2 = _DEST_RE.search(s)
         if m2:
             dest = m2.group(1)
             return f"I will make a move that will land on {dest}."
         return f"I will not be able to parse the move “{original}”."
 
-    piece = m.group("piece") or "P"  # Pawn if no letter
-    disambig = m.group("disambig") or ""
-    capture = bool(m.group("capture"))
-    dest = m.group("dest")
-    promo = m.group("promo1") or m.group("promo2")
+    piece, disambig, capture, dest, promo = parsed
+    piece = piece or "P"  # Pawn if no letter
 
     piece_name = piece_names.get(piece, "pawn") if piece != "P" else "pawn"
 
@@ -113,23 +152,24 @@ def describe_san_first_person(move: str, side: str | None = None) -> str:
     # Build the sentence core (future tense)
     if capture:
         if ep and piece == "P":
-            base = f"I will capture en passant on {dest} with my pawn{from_phrase}"
+            parts = ["I will capture en passant on ", dest, " with my pawn", from_phrase]
         else:
-            base = f"I will capture on {dest} with my {piece_name}{from_phrase}"
+            parts = ["I will capture on ", dest, " with my ", piece_name, from_phrase]
     else:
         if piece == "P":
-            base = f"I will advance my pawn{from_phrase} to {dest}"
+            parts = ["I will advance my pawn", from_phrase, " to ", dest]
         else:
-            base = f"I will move my {piece_name}{from_phrase} to {dest}"
+            parts = ["I will move my ", piece_name, from_phrase, " to ", dest]
 
     # Promotion (future tense explicitly)
     if promo:
         promo_name = piece_names[promo]
-        base += f", and I will promote to {article(promo_name)}"
+        parts += (", and I will promote to ", article(promo_name))
 
-    return add_check_suffix(base, chk)
+    return add_check_suffix(parts, chk)
 
 
+@lru_cache(maxsize=4096)
 def describe_san(move: str, side: str | None = None) -> str:
     """
     Convert a SAN chess move into a terse third-person description:
@@ -155,16 +195,16 @@ def describe_san(move: str, side: str | None = None) -> str:
     s = original
 
     # En passant marker
-    ep = bool(re.search(r'\b(e\.?p\.?)\b', s, flags=re.IGNORECASE))
-    s = re.sub(r'\s*\b(e\.?p\.?)\b', '', s, flags=re.IGNORECASE).strip()
+    ep = bool(_EP_RE.search(s))
+    s = _EP_STRIP_RE.sub('', s).strip()
 
     # Strip check/mate symbols and trailing annotations
-    s = re.sub(r'(#|\+\+|\+)([!?]*)$', '', s).strip()
-    s = re.sub(r'[!?]+$', '', s).strip()
+    s = _CHK_RE.sub('', s).strip()
+    s = _ANN_RE.sub('', s).strip()
 
     # Castling
-    if re.fullmatch(r'(O|0)-(O|0)(-(O|0))?', s):
-        is_queenside = bool(re.search(r'-(O|0)$', s))
+    if _CASTLE_RE.fullmatch(s):
+        is_queenside = bool(_QUEENSIDE_RE.search(s))
         file_letter = "c" if is_queenside else "g"
         dest = side_square(file_letter, side)
         if dest:
@@ -172,36 +212,26 @@ def describe_san(move: str, side: str | None = None) -> str:
         return "Queenside castling" if is_queenside else "Kingside castling"
 
     # General SAN parsing
-    pattern = re.compile(
-        r'^(?P<piece>[KQRBN])?'                # Optional piece (pawn if absent)
-        r'(?P<disambig>[a-h1-8]{0,2})'         # Optional disambiguation (ignored in output)
-        r'(?P<capture>x)?'                     # Optional capture
-        r'(?P<dest>[a-h][1-8])'                # Destination
-        r'(?:=(?P<promo1>[QRBN])|(?P<promo2>[QRBN]))?'  # Optional promotion
-        r'$'
-    )
-    m = pattern.match(s)
-    if not m:
-        m2 = re.search(r'([a-h][1-8])', s)
+    parsed = _parse_san(s)
+    if parsed is None:
+        m2 = _DEST_RE.search(s)
         if m2:
             # Fallback when we at least see a destination
             return f"Move to {m2.group(1)}"
         return f"Unrecognized move: “{original}”"
 
-    piece = m.group("piece") or "P"  # Pawn if no letter
-    capture = bool(m.group("capture"))
-    dest = m.group("dest")
-    promo = m.group("promo1") or m.group("promo2")
+    piece, _, capture, dest, promo = parsed
+    piece = piece or "P"  # Pawn if no letter
 
     piece_name = piece_names.get(piece, "Pawn") if piece != "P" else "Pawn"
 
-    base = f"{piece_name} takes {dest}" if capture else f"{piece_name} to {dest}"
+    parts = [piece_name, " takes " if capture else " to ", dest]
 
     # Promotion and en passant annotations
     if promo:
         promo_name = piece_names[promo]
-        base += f" (promotes to {promo_name})"
+        parts += (" (promotes to ", promo_name, ")")
     if ep and piece == "P" and capture:
-        base += " (en passant)"
+        parts.append(" (en passant)")
 
-    return base
\ No newline at end of file
+    return "".join(parts)
\ No newline at end of file
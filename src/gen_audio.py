@@ -1,16 +1,24 @@
 from __future__ import annotations
 import argparse
+import atexit
 import base64
 import io
 import os
+import select
+import shutil
+import socket
+import socketserver
+import subprocess
 import sys
 import threading
 import time
+import wave
 from contextlib import contextmanager
 from typing import Optional
 
 import paramiko
 import requests
+from requests.adapters import HTTPAdapter
 import sounddevice as sd
 import soundfile as sf
 from functools import partial
@@ -26,10 +34,76 @@ KEYFILE_NAME = os.getenv("GEN_AUDIO_KEYFILE", "~/.ssh/id_rsa")
 LOCAL_PORT = int(os.getenv("GEN_AUDIO_LOCAL_PORT", "8000"))
 REMOTE_HOST = os.getenv("GEN_AUDIO_REMOTE_HOST", "127.0.0.1")
 REMOTE_PORT = int(os.getenv("GEN_AUDIO_REMOTE_PORT", "8000"))
-MODE = os.getenv("GEN_AUDIO_MODE", "base64")  # "base64" or "url"
+MODE = os.getenv("GEN_AUDIO_MODE", "stream")  # "stream", "binary", "base64" or "url"
+USE_OPENSSH = os.getenv("GEN_AUDIO_OPENSSH", "1") != "0"  # prefer the system ssh client for key auth
+
+# SSH channel sizing for the tunnel: a wide window so the server isn't
+# stalled waiting for window adjusts while it streams audio back
+CHANNEL_WINDOW_SIZE = 16 * 1024 * 1024
+CHANNEL_MAX_PACKET_SIZE = 256 * 1024
+FORWARD_CHUNK = 256 * 1024  # bytes moved per read in the forwarder
+
+# Kept-alive HTTP connections through the tunnel, shared by every request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 
 # SSH tunnel helper
+class _ForwardServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _channel_sendall(chan, data):
+    """
+    Send all of `data` on a paramiko channel. Channel.sendall re-slices the
+    remaining bytes after every partial send (one packet per send), which
+    copies a large read many times over; a memoryview walks it without copies.
+    """
+    view = memoryview(data)
+    while view:
+        sent = chan.send(view)
+        if sent == 0:
+            raise socket.error("Socket is closed")
+        view = view[sent:]
+
+
+class _ForwardHandler(socketserver.BaseRequestHandler):
+    """Pipe one local connection through a direct-tcpip channel on the SSH transport."""
+
+    def handle(self):
+        fwd = self.server.forwarder
+        try:
+            chan = fwd.transport.open_channel(
+                "direct-tcpip",
+                (fwd.remote_host, fwd.remote_port),
+                self.request.getpeername(),
+                window_size=CHANNEL_WINDOW_SIZE,
+                max_packet_size=CHANNEL_MAX_PACKET_SIZE,
+            )
+        except Exception as e:
+            print(f"Tunnel channel to {fwd.remote_host}:{fwd.remote_port} failed: {e}", file=sys.stderr)
+            return
+        # Local reads land in one reused buffer; paramiko channels have no
+        # recv_into, so the other direction still gets a bytes per read
+        buf = memoryview(bytearray(FORWARD_CHUNK))
+        try:
+            while True:
+                r, _, _ = select.select([self.request, chan], [], [])
+                if self.request in r:
+                    n = self.request.recv_into(buf)
+                    if not n:
+                        break
+                    _channel_sendall(chan, buf[:n])
+                if chan in r:
+                    data = chan.recv(FORWARD_CHUNK)
+                    if not data:
+                        break
+                    self.request.sendall(data)
+        finally:
+            chan.close()
+
+
 class _Forwarder(threading.Thread):
     def __init__(self, transport, local_host, local_port, remote_host, remote_port):
         super().__init__(daemon=True)
@@ -39,6 +113,19 @@ class _Forwarder(threading.Thread):
         self.remote_host = remote_host
         self.remote_port = remote_port
         self._server = None
+        self.ready = threading.Event()  # set once the local port is listening
+
+    def run(self):
+        try:
+            self._server = _ForwardServer((self.local_host, self.local_port), _ForwardHandler)
+        except OSError as e:
+            print(f"Could not bind {self.local_host}:{self.local_port}: {e}", file=sys.stderr)
+            return
+        finally:
+            self.ready.set()
+        self._server.forwarder = self
+        self._server.serve_forever()
+        self._server.server_close()
 
     def stop(self):
         try:
@@ -47,8 +134,63 @@ class _Forwarder(threading.Thread):
         except Exception:
             pass
 
-@contextmanager
-def ssh_tunnel(
+def _open_openssh_tunnel(
+    host: str,
+    port: int,
+    username: str,
+    key_filename: Optional[str],
+    local_port: int,
+    remote_host: str,
+    remote_port: int,
+    timeout: float = 15,
+) -> Optional[subprocess.Popen]:
+    """
+    Forward localhost:<local_port> with a native `ssh -N -L` process, which does
+    the crypto and framing in OpenSSH instead of Python. Returns the process once
+    the local port accepts connections, or None if ssh exited first. Raises
+    OSError if the local port is already taken.
+    """
+    # Something already listening on the port would answer the readiness probe
+    # below in place of the forward (and the paramiko fallback couldn't bind it
+    # either), so refuse a taken port. SO_REUSEADDR, as ssh's own listener uses,
+    # keeps TIME_WAIT leftovers from a previous run from counting as taken.
+    with socket.socket() as probe:
+        probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            probe.bind(("127.0.0.1", local_port))
+        except OSError as e:
+            raise OSError(f"Local tunnel port 127.0.0.1:{local_port} is already in use: {e}") from e
+
+    cmd = [
+        "ssh", "-N",
+        "-p", str(port),
+        "-o", "BatchMode=yes",
+        "-o", "Compression=no",
+        "-o", "ExitOnForwardFailure=yes",
+        "-o", "StrictHostKeyChecking=accept-new",
+        "-o", "ServerAliveInterval=30",
+        "-o", "LogLevel=ERROR",
+        "-L", f"127.0.0.1:{local_port}:{remote_host}:{remote_port}",
+    ]
+    if key_filename and os.path.exists(os.path.expanduser(key_filename)):
+        cmd += ["-i", os.path.expanduser(key_filename)]
+    cmd.append(f"{username}@{host}")
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + timeout
+    while proc.poll() is None and time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", local_port), timeout=1).close()
+            if proc.poll() is None:  # the listener is ssh's, not a stray one
+                return proc
+            break
+        except OSError:
+            time.sleep(0.05)
+    _close_tunnel(proc, None)
+    return None
+
+
+def _open_tunnel(
     host: str, 
     port: int, 
     username: str, 
@@ -56,12 +198,27 @@ def ssh_tunnel(
     password: Optional[str],
     local_port: int, 
     remote_host: str, 
-    remote_port: int
+    remote_port: int,
+    openssh: bool = False,
 ):
     """
-    Open an SSH tunnel from localhost:<local_port> to remote_host:remote_port.
+    Connect over SSH and forward localhost:<local_port> to remote_host:remote_port.
+    Returns the (client, forwarder) pair. With `openssh` and key auth, the system
+    ssh client is tried first; then the client is its process and there is no forwarder.
     """
-    
+    if openssh and password is None and shutil.which("ssh"):
+        proc = _open_openssh_tunnel(
+            host, port, username, key_filename, local_port, remote_host, remote_port
+        )
+        if proc is not None:
+            return proc, None
+        print("ssh tunnel failed to start, falling back to paramiko", file=sys.stderr)
+
+    # Open the TCP connection ourselves so Nagle can be turned off: the
+    # tunnel carries small request/response packets that shouldn't be held back
+    sock = socket.create_connection((host, port), timeout=15)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
     client.connect(
@@ -73,33 +230,141 @@ def ssh_tunnel(
         timeout=15,
         allow_agent=True,
         look_for_keys=True,
+        sock=sock,
+    )
+    transport = client.get_transport()
+    fwd = _Forwarder(transport, "127.0.0.1", local_port, remote_host, remote_port)
+    fwd.start()
+    if not fwd.ready.wait(timeout=5) or fwd._server is None:
+        _close_tunnel(client, fwd)
+        raise OSError(f"Could not forward 127.0.0.1:{local_port} to {remote_host}:{remote_port}")
+    return client, fwd
+
+
+def _tunnel_active(client, fwd) -> bool:
+    if isinstance(client, subprocess.Popen):
+        return client.poll() is None
+    transport = client.get_transport()
+    return transport is not None and transport.is_active() and fwd.is_alive()
+
+
+def _close_tunnel(client, fwd):
+    if isinstance(client, subprocess.Popen):
+        client.terminate()
+        try:
+            client.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            client.kill()
+        return
+    try:
+        fwd.stop()
+    except Exception:
+        pass
+    try:
+        client.close()
+    except Exception:
+        pass
+
+
+@contextmanager
+def ssh_tunnel(
+    host: str, 
+    port: int, 
+    username: str, 
+    key_filename: Optional[str], 
+    password: Optional[str],
+    local_port: int, 
+    remote_host: str, 
+    remote_port: int
+):
+    """
+    Open an SSH tunnel from localhost:<local_port> to remote_host:remote_port.
+    """
+    client, fwd = _open_tunnel(
+        host, port, username, key_filename, password, local_port, remote_host, remote_port
     )
     try:
-        transport = client.get_transport()
-        fwd = _Forwarder(transport, "127.0.0.1", local_port, remote_host, remote_port)
-        fwd.start()
-        # crude wait for bind
-        time.sleep(0.2)
         yield client
     finally:
-        try:
-            fwd.stop()
-        except Exception:
-            pass
-        try:
-            client.close()
-        except Exception:
-            pass
+        _close_tunnel(client, fwd)
+
 
+# Persistent tunnels shared by every gen_audio_from_api call, one per destination
+_TUNNELS = {}
+_TUNNEL_LOCK = threading.Lock()
 
-def play_wav_bytes(wav_bytes: bytes):
-    """Play WAV audio from raw bytes."""
+
+def _ensure_tunnel(
+    host: str, 
+    port: int, 
+    username: str, 
+    key_filename: Optional[str], 
+    password: Optional[str],
+    local_port: int, 
+    remote_host: str, 
+    remote_port: int
+):
+    """
+    Open the SSH tunnel on first use and keep it for the life of the process.
+    Tunnels are cached by (host, port, username, local_port, remote_host,
+    remote_port); one whose transport has dropped is closed and reopened.
+    """
+    key = (host, port, username, local_port, remote_host, remote_port)
+    with _TUNNEL_LOCK:
+        tunnel = _TUNNELS.pop(key, None)
+        if tunnel is not None:
+            client, fwd = tunnel
+            if _tunnel_active(client, fwd):
+                _TUNNELS[key] = tunnel
+                return client
+            _close_tunnel(client, fwd)
+        _TUNNELS[key] = _open_tunnel(
+            host, port, username, key_filename, password, local_port, remote_host, remote_port,
+            openssh=USE_OPENSSH,
+        )
+        return _TUNNELS[key][0]
+
+
+@atexit.register
+def close_ssh():
+    """Close the HTTP session and every persistent SSH tunnel it runs over."""
+    # Client side first, so the kept-alive connections' TIME_WAIT doesn't land
+    # on the tunnel's side of local_port
+    SESSION.close()
+    with _TUNNEL_LOCK:
+        while _TUNNELS:
+            _close_tunnel(*_TUNNELS.popitem()[1])
+
+
+def play_wav_bytes(wav_bytes: bytes, block_frames: int = 4096):
+    """
+    Play WAV audio from raw bytes, decoding block by block as it plays.
+    The TTS server writes 16-bit PCM, so samples stay int16 end to end.
+    """
     mem = io.BytesIO(wav_bytes)
     with sf.SoundFile(mem, mode="r") as f:
-        audio = f.read(dtype="float32")
-        sr = f.samplerate
-    sd.play(audio, samplerate=sr)
-    sd.wait()
+        with sd.OutputStream(
+            samplerate=f.samplerate,
+            channels=f.channels,
+            dtype="int16",
+        ) as out:
+            for block in f.blocks(blocksize=block_frames, dtype="int16", always_2d=True):
+                out.write(block)
+
+
+def play_wav_stream(stream, block_frames: int = 2048):
+    """Play 16-bit PCM WAV audio from a file-like object while it is still arriving."""
+    with wave.open(stream, "rb") as wf:
+        with sd.RawOutputStream(
+            samplerate=wf.getframerate(),
+            channels=wf.getnchannels(),
+            dtype="int16",
+        ) as out:
+            while True:
+                block = wf.readframes(block_frames)
+                if not block:
+                    break
+                out.write(block)
 
 
 def gen_audio_from_api(
@@ -113,7 +378,7 @@ def gen_audio_from_api(
     local_port: int = LOCAL_PORT,
     remote_host: str = REMOTE_HOST,
     remote_port: str = REMOTE_PORT,
-    mode: str = MODE, # either base64 or url
+    mode: str = MODE, # stream, binary, base64 or url
     ):
     """
     Generate audio from text via remote API.
@@ -123,11 +388,12 @@ def gen_audio_from_api(
         temperature: Sampling temperature for generation.
         host/port/username/key_filename: SSH connection details.
         local_port/remote_host/remote_port: Tunnel settings.
-        mode: "base64" (default) or "url" for audio retrieval.
+        mode: "stream" (default, plays while downloading), "binary" (raw WAV
+              body), "base64" or "url" for audio retrieval.
 
     Side effect: Plays the generated audio locally.
     """
-    with ssh_tunnel(
+    _ensure_tunnel(
         host=host,
         port=port,
         username=username,
@@ -136,32 +402,43 @@ def gen_audio_from_api(
         local_port=local_port,
         remote_host=remote_host,
         remote_port=remote_port,
-    ):
-        endpoint = f"http://127.0.0.1:{local_port}/generate"
-        payload = {
-            "transcript": transcript,
-            "temperature": temperature,
-            "return_audio": mode,
-        }
-        r = requests.post(endpoint, json=payload, timeout=600)
-        r.raise_for_status()
-        data = r.json()
-
-        if mode == "base64":
-            b64 = data.get("audio_base64")
-            if not b64:
-                print("No audio_base64 in response", file=sys.stderr)
-                sys.exit(2)
-            wav = base64.b64decode(b64)
-            play_wav_bytes(wav)
-        else:
-            url = data.get("audio_url")
-            if not url:
-                print("No audio_url in response", file=sys.stderr)
-                sys.exit(3)
-            
-            audio = requests.get(url, timeout=600).content
-            play_wav_bytes(audio)
+    )
+    endpoint = f"http://127.0.0.1:{local_port}/generate"
+    payload = {
+        "transcript": transcript,
+        "temperature": temperature,
+        "return_audio": mode,
+    }
+    r = SESSION.post(endpoint, json=payload, timeout=600, stream=(mode in ("stream", "binary")))
+    r.raise_for_status()
+
+    if mode in ("stream", "binary"):
+        # Both are a WAV body; play it as it arrives instead of buffering it
+        with r:
+            r.raw.decode_content = True
+            play_wav_stream(r.raw)
+        return
+
+    data = r.json()
+
+    if mode == "base64":
+        b64 = data.get("audio_base64")
+        if not b64:
+            print("No audio_base64 in response", file=sys.stderr)
+            sys.exit(2)
+        wav = base64.b64decode(b64)
+        play_wav_bytes(wav)
+    else:
+        url = data.get("audio_url")
+        if not url:
+            print("No audio_url in response", file=sys.stderr)
+            sys.exit(3)
+
+        # Play while downloading instead of fetching the whole file first
+        with SESSION.get(url, timeout=600, stream=True) as audio:
+            audio.raise_for_status()
+            audio.raw.decode_content = True
+            play_wav_stream(audio.raw)
 
 # Wrapper with default args
 play_gen_audio = partial(
@@ -1,10 +1,68 @@
-import requests
-import wave
-import tempfile
+import io
 import os
+import requests
+import struct
+import numpy as np
+import soundfile as sf
+from requests.adapters import HTTPAdapter
 
 SERVER = "http://localhost:8080/transcribe"  # via SSH tunnel
 RATE = 16000
+UPLOAD_FORMAT = os.getenv("TRANSCRIBE_UPLOAD_FORMAT", "flac")  # "flac", "wav" or "pcm"
+
+# One long-lived HTTP session so every move reuses the same connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2, pool_block=False))
+
+
+def pcm_to_wav_bytes(pcm: bytes) -> bytes:
+    """Wrap raw mono PCM16 audio in a WAV container (one 44-byte RIFF header)."""
+    n = len(pcm)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + n, b"WAVE",
+        b"fmt ", 16, 1, 1, RATE, RATE * 2, 2, 16,
+        b"data", n,
+    )
+    return header + pcm
+
+
+def pcm_to_flac_bytes(pcm: bytes) -> bytes:
+    """Losslessly compress raw mono PCM16 audio to FLAC (roughly half the size of WAV)."""
+    mem = io.BytesIO()
+    sf.write(mem, np.frombuffer(pcm, dtype=np.int16), RATE, format="FLAC", subtype="PCM_16")
+    return mem.getvalue()
+
+
+def encode_upload(pcm: bytes) -> tuple[bytes, str]:
+    """Encode PCM16 audio for upload; returns the body and its Content-Type."""
+    if UPLOAD_FORMAT == "flac":
+        return pcm_to_flac_bytes(pcm), "audio/flac"
+    if UPLOAD_FORMAT == "pcm":
+        # Raw samples as captured; the server adds the WAV header itself
+        return pcm, f"audio/x-pcm-s16le; rate={RATE}; channels=1"
+    return pcm_to_wav_bytes(pcm), "audio/wav"
+
+
+# 0.1 s of silence, enough to make the server run the model once
+SILENCE_BODY, SILENCE_TYPE = encode_upload(b"\x00\x00" * (RATE // 10))
+
+
+def warmup():
+    """
+    Prime the transcription path before the first real move: open the
+    kept-alive connection and have the server load and run the ASR model.
+    Failures are ignored; the first move then just pays the cold start.
+    """
+    try:
+        SESSION.post(
+            SERVER,
+            data=SILENCE_BODY,
+            headers={"Content-Type": SILENCE_TYPE},
+            timeout=60,
+        )
+    except requests.RequestException:
+        pass
 
 
 # Send audio to server and get transcription
@@ -18,34 +76,28 @@ def transcribe_audio(audio_bytes):
     Returns:
         str: The transcription of the audio.
     """
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmpfile:
-        path = tmpfile.name
-        with wave.open(path, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(RATE)
-            wf.writeframes(audio_bytes)
-
+    body, content_type = encode_upload(audio_bytes)
+    resp = SESSION.post(
+        SERVER,
+        data=body,
+        headers={"Content-Type": content_type},
+        timeout=60,
+    )
     try:
-        with open(path, "rb") as f:
-            resp = requests.post(SERVER, files={"audio": f}, timeout=60)
-            try:
-                data = resp.json()
-                # Preferred format:
-                transcription = data.get("transcription")
-                if transcription is None:
-                    # Fallback if server returns {"text": "..."}
-                    transcription = data.get("text", "")
-                    if transcription:
-                        print("Using 'text' key from server JSON")
-                    else:
-                        print("Server response missing transcription/text:", data)
-                return transcription
-            except Exception as e:
-                print("Failed to parse server JSON:", e, resp.text)
-                return ""
-    finally:
-        os.remove(path)
+        data = resp.json()
+        # Preferred format:
+        transcription = data.get("transcription")
+        if transcription is None:
+            # Fallback if server returns {"text": "..."}
+            transcription = data.get("text", "")
+            if transcription:
+                print("Using 'text' key from server JSON")
+            else:
+                print("Server response missing transcription/text:", data)
+        return transcription
+    except Exception as e:
+        print("Failed to parse server JSON:", e, resp.text)
+        return ""
                     
                     
 # Test loop
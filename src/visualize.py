@@ -2,17 +2,31 @@ import chess
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 
+# Model square shown at each view position (vx, vy), per perspective
+_VIEW_SQUARES = {
+    "white": {(vx, vy): chess.square(vx, vy) for vy in range(8) for vx in range(8)},
+    "black": {(vx, vy): chess.square(7 - vx, 7 - vy) for vy in range(8) for vx in range(8)},
+}
+# Unicode glyph for each (piece type, color)
+_SYMBOLS = {(pt, c): chess.Piece(pt, c).unicode_symbol() for pt in chess.PIECE_TYPES for c in chess.COLORS}
+
 class BoardViewer:
+    LIGHT = "#f0d9b5"
+    DARK = "#b58863"
+    HIGHLIGHT = "#f6f669"
+
     def __init__(self, perspective="white"):
         assert perspective in ("white", "black")
         self.perspective = perspective
         self.fig = None
         self.ax = None
+        self._last_drawn = None  # what the canvas currently shows
         self._init_fig()
 
     def _init_fig(self):
         # plt.ion() should be called in the main script before importing pyplot
         self.fig, self.ax = plt.subplots(figsize=(8, 8))
+        self._last_drawn = None
         try:
             # Some backends don’t have a manager or set_window_title
             self.fig.canvas.manager.set_window_title("VoiceChess")
@@ -21,98 +35,154 @@ class BoardViewer:
         self.ax.set_xticks([])
         self.ax.set_yticks([])
         self.ax.set_aspect("equal")
+        self._build_artists()
         # Show once, non-blocking (since interactive mode is on in the entry script)
         try:
             self.fig.show()
         except Exception:
             plt.show(block=False)
 
+    def _build_artists(self):
+        """Create the square, piece, label and caption artists once; update() only edits them."""
+        ax = self.ax
+        self._squares = {}
+        self._pieces = {}
+        # What each artist currently shows, so update() only touches what changed
+        self._square_colors = {}
+        self._piece_symbols = {}
+        self._labels_perspective = None
+        self._caption_room = False
+        # When the canvas can blit, squares, pieces and caption are animated:
+        # they are painted by _on_draw/_blit instead of the normal draw loop, and
+        # changing them doesn't mark the figure stale (which would force a full redraw)
+        self._blit = self.fig.canvas.supports_blit
+        self._bg = None
+        for vy in range(8):
+            for vx in range(8):
+                self._squares[vx, vy] = ax.add_patch(
+                    patches.Rectangle((vx, vy), 1, 1, facecolor=self.LIGHT, animated=self._blit))
+                self._pieces[vx, vy] = ax.text(vx + 0.5, vy + 0.5, "", animated=self._blit,
+                                               fontsize=36, ha='center', va='center')
+        self._rank_labels = [ax.text(-0.3, vy + 0.5, "", fontsize=14, ha='right', va='center',
+                                     animated=self._blit)
+                             for vy in range(8)]
+        self._file_labels = [ax.text(vx + 0.5, -0.3, "", fontsize=14, ha='center', va='top',
+                                     animated=self._blit)
+                             for vx in range(8)]
+        self._caption = ax.text(3.5 + 0.5, 8.55, "",
+                                ha='center', va='bottom', fontsize=14, visible=False, animated=self._blit,
+                                bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8, linewidth=0))
+        ax.set_xlim(-0.5, 8)
+        ax.set_ylim(-0.5, 8)
+        if self._blit:
+            # The axes frame overlaps the board edge (and the labels overlap the
+            # frame), so both are painted after the squares
+            for spine in ax.spines.values():
+                spine.set_animated(True)
+            self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _draw_overlay(self):
+        """Paint what sits on top of the board: axes frame, labels and caption."""
+        for artist in (*self.ax.spines.values(), *self._rank_labels, *self._file_labels, self._caption):
+            self.ax.draw_artist(artist)
+
+    def _on_draw(self, event):
+        """After a full redraw: paint the board, keep it as the blit background, add the overlay."""
+        if self.fig.canvas.is_saving():
+            # savefig draws animated artists itself; redraw fully on the next update
+            self._bg = None
+            return
+        for rect in self._squares.values():
+            self.ax.draw_artist(rect)
+        for piece in self._pieces.values():
+            self.ax.draw_artist(piece)
+        self._bg = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_overlay()
+
+    def _blit_squares(self, dirty):
+        """Repaint only the given view squares and the overlay, then blit."""
+        canvas = self.fig.canvas
+        canvas.restore_region(self._bg)  # last board, without the overlay
+        for key in dirty:
+            self.ax.draw_artist(self._squares[key])
+            self.ax.draw_artist(self._pieces[key])
+        self._bg = canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_overlay()
+        canvas.blit(self.fig.bbox)
+
     def is_open(self):
         try:
             return plt.fignum_exists(self.fig.number)
         except Exception:
             return False
 
-    # ---------- Mapping helpers ----------
-    def _model_to_view(self, file_idx: int, rank_idx: int):
-        if self.perspective == "white":
-            return file_idx, rank_idx
-        else:  # black
-            return 7 - file_idx, 7 - rank_idx
-
-    def _view_to_model(self, vx: int, vy: int):
-        if self.perspective == "white":
-            return vx, vy
-        else:
-            return 7 - vx, 7 - vy
-
     def update(self, board: chess.Board, show_last_move: bool = True, text: str | None = None):
         """
         Redraw the board. If `text` is provided, it is displayed centered above the board.
+        Nothing is redrawn if the position, highlight, caption and perspective are unchanged.
         """
         if not self.is_open():
             self._init_fig()
 
-        ax = self.ax
-        ax.clear()
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_aspect("equal")
-
-        light = "#f0d9b5"
-        dark = "#b58863"
-        highlight = "#f6f669"
+        last_move = board.move_stack[-1] if (show_last_move and board.move_stack) else None
+        state = (board.board_fen(), last_move, text, self.perspective)
+        if state == self._last_drawn:
+            return
+        self._last_drawn = state
 
         # Last move (model coords)
         last_from = last_to = None
-        if show_last_move and board.move_stack:
-            m = board.move_stack[-1]
-            last_from, last_to = m.from_square, m.to_square
-
-        # Draw squares
-        for vy in range(8):
-            for vx in range(8):
-                mf, mr = self._view_to_model(vx, vy)
-                model_sq = chess.square(mf, mr)
-                color = highlight if model_sq in (last_from, last_to) \
-                        else (light if (vx + vy) % 2 == 0 else dark)
-                ax.add_patch(patches.Rectangle((vx, vy), 1, 1, facecolor=color))
-
-        # Draw pieces
-        for sq in chess.SQUARES:
-            piece = board.piece_at(sq)
-            if not piece:
-                continue
-            mf = chess.square_file(sq)
-            mr = chess.square_rank(sq)
-            vx, vy = self._model_to_view(mf, mr)
-            ax.text(vx + 0.5, vy + 0.5, piece.unicode_symbol(),
-                    fontsize=36, ha='center', va='center')
-
-        # Rank labels (left edge of the displayed board)
-        for vy in range(8):
-            label = str(vy + 1) if self.perspective == "white" else str(8 - vy)
-            ax.text(-0.3, vy + 0.5, label, fontsize=14, ha='right', va='center')
-
-        # File labels (bottom edge)
-        for vx in range(8):
-            label = chr(ord('a') + vx) if self.perspective == "white" else chr(ord('h') - vx)
-            ax.text(vx + 0.5, -0.3, label, fontsize=14, ha='center', va='top')
+        if last_move is not None:
+            last_from, last_to = last_move.from_square, last_move.to_square
+
+        # Recolor squares and set the piece on each one
+        dirty = []
+        view_squares = _VIEW_SQUARES[self.perspective]
+        pieces = board.piece_map()
+        for (vx, vy), rect in self._squares.items():
+            model_sq = view_squares[vx, vy]
+            color = self.HIGHLIGHT if model_sq in (last_from, last_to) \
+                    else (self.LIGHT if (vx + vy) % 2 == 0 else self.DARK)
+            piece = pieces.get(model_sq)
+            symbol = _SYMBOLS[piece.piece_type, piece.color] if piece else ""
+            if self._square_colors.get((vx, vy)) != color or self._piece_symbols.get((vx, vy)) != symbol:
+                rect.set_facecolor(color)
+                self._pieces[vx, vy].set_text(symbol)
+                self._square_colors[vx, vy] = color
+                self._piece_symbols[vx, vy] = symbol
+                dirty.append((vx, vy))
+
+        # Anything outside the animated artists (the axes limits) needs a full redraw
+        full_redraw = not self._blit or self._bg is None
+
+        if self._labels_perspective != self.perspective:
+            self._labels_perspective = self.perspective
+
+            # Rank labels (left edge of the displayed board)
+            for vy, label in enumerate(self._rank_labels):
+                label.set_text(str(vy + 1) if self.perspective == "white" else str(8 - vy))
+
+            # File labels (bottom edge)
+            for vx, label in enumerate(self._file_labels):
+                label.set_text(chr(ord('a') + vx) if self.perspective == "white" else chr(ord('h') - vx))
 
         # --- Optional caption above the board ---
         if text:
-            # Give a bit of extra headroom and draw the text centered
-            ax.set_xlim(-0.5, 8)
-            ax.set_ylim(-0.5, 8.9)  # was 8; add ~0.9 for the caption
-            ax.text(3.5 + 0.5, 8.55, text,
-                    ha='center', va='bottom', fontsize=14,
-                    bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8, linewidth=0))
+            self._caption.set_text(text)
+            self._caption.set_visible(True)
         else:
-            ax.set_xlim(-0.5, 8)
-            ax.set_ylim(-0.5, 8)
-
-        # The crucial trio:
-        self.fig.canvas.draw_idle()
+            self._caption.set_visible(False)
+        if self._caption_room != bool(text):
+            # Give a bit of extra headroom for the caption
+            self._caption_room = bool(text)
+            self.ax.set_ylim(-0.5, 8.9 if text else 8)  # add ~0.9 for the caption
+            full_redraw = True
+
+        if full_redraw:
+            # The crucial trio:
+            self.fig.canvas.draw_idle()
+        else:
+            self._blit_squares(dirty)
         try:
             self.fig.canvas.flush_events()
         except Exception:
@@ -121,3 +191,8 @@ class BoardViewer:
 
     def flip(self):
         self.perspective = "black" if self.perspective == "white" else "white"
+
+    def set_perspective(self, perspective: str):
+        """Set the side shown at the bottom; takes effect on the next update()."""
+        assert perspective in ("white", "black")
+        self.perspective = perspective